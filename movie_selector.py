@@ -30,6 +30,7 @@ from routes.trakt_routes import trakt_bp
 from utils.emby_service import EmbyService
 from utils.tv import TVFactory
 from utils.tv.base.tv_discovery import TVDiscoveryFactory
+from utils.tv.discovery.webos_ssdp import ssdp_listener
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -604,6 +605,9 @@ playback_monitor = PlaybackMonitor(app, interval=10)
 app.config['PLAYBACK_MONITOR'] = playback_monitor
 playback_monitor.start()
 
+# Listen for WebOS TVs announcing themselves over SSDP
+ssdp_listener.start()
+
 # Flask Routes
 @app.route('/')
 def index():
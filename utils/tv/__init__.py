@@ -1 +1,2 @@
 from .base.tv_factory import TVFactory
+from . import discovery  # Registers TV discovery implementations
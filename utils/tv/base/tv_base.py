@@ -2,11 +2,30 @@ from abc import ABC, abstractmethod
 import socket
 import logging
 import asyncio
+import functools
 from typing import Optional, Dict, Any
 from utils.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Shared broadcast socket for Wake-on-LAN, created on first use
+_wol_sock = None
+
+def _get_wol_socket() -> socket.socket:
+    global _wol_sock
+    if _wol_sock is None:
+        _wol_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        _wol_sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+    return _wol_sock
+
+@functools.lru_cache(maxsize=8)
+def _wol_packet(mac: str) -> bytes:
+    """Build the Wake-on-LAN magic packet for a MAC address"""
+    mac_address = mac.replace(':', '').replace('-', '')
+    if len(mac_address) != 12:
+        raise ValueError("Invalid MAC address format")
+    return bytes.fromhex('FF' * 6 + mac_address * 16)
+
 class TVControlBase(ABC):
     """Base class for TV control implementations"""
 
@@ -87,19 +106,7 @@ class TVControlBase(ABC):
             return False
 
         try:
-            # Clean up MAC address format
-            mac_address = str(self.mac).replace(':', '').replace('-', '')
-            if len(mac_address) != 12:
-                raise ValueError("Invalid MAC address format")
-
-            # Create magic packet
-            data = bytes.fromhex('FF' * 6 + mac_address * 16)
-
-            # Send packet
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-            sock.sendto(data, ('<broadcast>', 9))
-
+            _get_wol_socket().sendto(_wol_packet(str(self.mac)), ('<broadcast>', 9))
             logger.info(f"Wake-on-LAN packet sent to {self.mac}")
             return True
 
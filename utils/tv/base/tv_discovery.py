@@ -1,13 +1,158 @@
+import asyncio
+import errno
 import logging
 import re
+import select
+import socket
 import subprocess
-from typing import List, Dict, Any, Optional
+import threading
+import time
+import weakref
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, FrozenSet, Tuple, AsyncIterator
 from abc import ABC, abstractmethod
 
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=1)
+def _blacklist_set(mac_addresses: tuple) -> FrozenSet[str]:
+    """Build lowercase MAC blacklist, cached until the configured list changes"""
+    return frozenset(addr.lower() for addr in mac_addresses)
+
+def _get_blacklist_set() -> FrozenSet[str]:
+    """Get blacklisted MAC addresses from settings as a lowercase set"""
+    from utils.settings import settings
+    blacklisted_macs = settings.get('clients', {}).get('tvs', {}).get('blacklist', {}).get('mac_addresses', [])
+    return _blacklist_set(tuple(blacklisted_macs))
+
+PROC_ARP_PATH = '/proc/net/arp'
+
+# arp-scan result row: IP, MAC and optional vendor, tab separated.
+# Banner and summary lines don't match and are skipped.
+_ARP_RE = re.compile(r'^(\d+\.\d+\.\d+\.\d+)\t([0-9a-f:]{17})\t?(.*)$', re.I | re.M)
+
+# (ip, mac, vendor description) as reported by the ARP source
+ArpEntry = Tuple[str, str, Optional[str]]
+
+def _run_arp_scan() -> List[ArpEntry]:
+    """Actively sweep the local network with arp-scan"""
+    result = subprocess.run(
+        ['arp-scan', '--localnet'],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return _parse_arp_scan(result.stdout)
+
+def _parse_arp_scan(output: str) -> List[ArpEntry]:
+    """Extract (ip, mac, description) rows from arp-scan output"""
+    return [
+        (m.group(1), m.group(2), m.group(3) or None)
+        for m in _ARP_RE.finditer(output)
+    ]
+
+async def _stream_arp_scan() -> AsyncIterator[ArpEntry]:
+    """Run arp-scan without blocking the event loop, yielding rows as they are printed"""
+    process = await asyncio.create_subprocess_exec(
+        'arp-scan', '--localnet',
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        while True:
+            line = await process.stdout.readline()
+            if not line:
+                break
+            m = _ARP_RE.match(line.decode(errors='ignore').rstrip('\r\n'))
+            if m:
+                yield (m.group(1), m.group(2), m.group(3) or None)
+    finally:
+        if process.returncode is None and not process.stdout.at_eof():
+            process.kill()
+        stderr = await process.stderr.read()
+        await process.wait()
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, 'arp-scan', None, stderr)
+
+def _read_proc_arp() -> List[ArpEntry]:
+    """Read the kernel ARP cache in-process (no sweep, no vendor names)"""
+    entries = []
+    with open(PROC_ARP_PATH, 'r') as f:
+        next(f, None)  # Skip header
+        for line in f:
+            parts = line.split()
+            # IP address, HW type, Flags, HW address, Mask, Device
+            if len(parts) < 4 or parts[2] == '0x0' or parts[3] == '00:00:00:00:00:00':
+                continue
+            entries.append((parts[0], parts[3], None))
+    return entries
+
+# Last ARP sweep shared by all discoveries: (timestamp, rows)
+ARP_CACHE_TTL = 10
+_arp_cache: Optional[Tuple[float, List[ArpEntry]]] = None
+_arp_lock = threading.Lock()
+
+def _get_cached_arp_table(ttl: float) -> Optional[List[ArpEntry]]:
+    if _arp_cache and time.monotonic() - _arp_cache[0] < ttl:
+        return _arp_cache[1]
+    return None
+
+def _set_cached_arp_table(entries: List[ArpEntry]):
+    global _arp_cache
+    _arp_cache = (time.monotonic(), entries)
+
+def _get_arp_table(ttl: float = ARP_CACHE_TTL) -> List[ArpEntry]:
+    """Get (ip, mac, description) rows, sweeping only if the cached table is older than ttl"""
+    with _arp_lock:
+        entries = _get_cached_arp_table(ttl)
+        if entries is not None:
+            logger.debug("Using cached ARP table")
+            return entries
+
+        try:
+            entries = _run_arp_scan()
+        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+            logger.warning(f"arp-scan unavailable ({e}), falling back to {PROC_ARP_PATH}")
+            entries = _read_proc_arp()
+        _set_cached_arp_table(entries)
+        return entries
+
+# asyncio locks are bound to a single event loop and the web routes create
+# a new loop per request, so keep one lock per running loop
+_arp_async_locks = weakref.WeakKeyDictionary()
+
+async def _iter_arp_table_async(ttl: float = ARP_CACHE_TTL) -> AsyncIterator[ArpEntry]:
+    """Async variant of _get_arp_table sharing the same cache, yielding rows as the sweep finds them"""
+    loop = asyncio.get_running_loop()
+    lock = _arp_async_locks.setdefault(loop, asyncio.Lock())
+    async with lock:
+        entries = _get_cached_arp_table(ttl)
+        if entries is not None:
+            logger.debug("Using cached ARP table")
+            for entry in entries:
+                yield entry
+            return
+
+        entries = []
+        try:
+            async for entry in _stream_arp_scan():
+                entries.append(entry)
+                yield entry
+        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+            logger.warning(f"arp-scan unavailable ({e}), falling back to {PROC_ARP_PATH}")
+            seen = {mac.lower() for _, mac, _ in entries}
+            fallback = await loop.run_in_executor(None, _read_proc_arp)
+            for entry in fallback:
+                if entry[1].lower() not in seen:
+                    entries.append(entry)
+                    yield entry
+        _set_cached_arp_table(entries)
+
 class TVDiscoveryBase(ABC):
     """Base class for TV discovery implementations"""
+
+    # Key this implementation is registered under, set by TVDiscoveryFactory.register
+    tv_type: Optional[str] = None
     
     @abstractmethod
     def get_name(self) -> str:
@@ -23,62 +168,74 @@ class TVDiscoveryBase(ABC):
         """Get implementation-specific warning message or None if not needed"""
         return None
     
-    def scan_network(self) -> List[Dict[str, str]]:
+    def build_device(self, ip: str, mac: str, desc: Optional[str]) -> Dict[str, Any]:
+        """Build device info for a MAC/description already classified as this TV type"""
+        prefixes = self.get_mac_prefixes()
+        mac_prefix = mac.upper()[:8]
+        warning_msg = self.get_warning_message()
+
+        device = {
+            'ip': ip,
+            'mac': mac,
+            'description': desc or prefixes.get(mac_prefix, f'{self.get_name()} Device'),
+            'device_type': prefixes.get(mac_prefix, f'Unknown {self.get_name()} Model'),
+            'untested': bool(warning_msg),  # Only true if there's a warning
+            'warning': warning_msg  # Will be None for WebOS
+        }
+
+        # Add any additional device-specific information
+        self._enrich_device_info(device)
+        logger.info(f"Found {self.get_name()} device: {ip} ({mac}) - {desc}")
+        logger.info(warning_msg)
+        return device
+
+    def scan_network(self) -> List[Dict[str, Any]]:
         """Scan network for TVs of this type"""
+        return [
+            device for device in TVDiscoveryFactory.scan_network()
+            if device['tv_type'] == self.tv_type
+        ]
+
+    def _probe_ports(self, ip: str, ports: List[int], timeout: float = 1.0) -> bool:
+        """Connect to all ports at once and wait for any to accept within timeout"""
+        socks = {}
         try:
-            # Get blacklisted MAC addresses from settings
-            from utils.settings import settings
-            blacklisted_macs = settings.get('clients', {}).get('tvs', {}).get('blacklist', {}).get('mac_addresses', [])
-            logger.debug(f"Loaded blacklist: {blacklisted_macs}")
-            
-            # Run arp-scan to find devices
-            result = subprocess.run(
-                ['arp-scan', '--localnet'],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            devices = []
-            for line in result.stdout.splitlines():
-                if '\t' not in line:
-                    continue
-                parts = line.strip().split('\t')
-                if len(parts) >= 2:
-                    ip, mac = parts[0], parts[1]
-                    desc = parts[2] if len(parts) > 2 else None
-                    
-                    # Skip blacklisted devices
-                    if mac.lower() in (addr.lower() for addr in blacklisted_macs):
-                        logger.debug(f"Skipping blacklisted device: {mac}")
-                        continue
-                        
-                    # Get MAC prefix for manufacturer check
-                    mac_prefix = mac.upper()[:8]
-                    # Check if this is one of our TVs
-                    if mac_prefix in self.get_mac_prefixes() or self._is_tv_device(desc):
-                        warning_msg = self.get_warning_message()
-
-                        device = {
-                            'ip': ip,
-                            'mac': mac,
-                            'description': desc or self.get_mac_prefixes().get(mac_prefix, f'{self.get_name()} Device'),
-                            'device_type': self.get_mac_prefixes().get(mac_prefix, f'Unknown {self.get_name()} Model'),
-                            'untested': bool(warning_msg),  # Only true if there's a warning
-                            'warning': warning_msg  # Will be None for WebOS
-                        }
-                        
-                        # Add any additional device-specific information
-                        self._enrich_device_info(device)
-                        devices.append(device)
-                        logger.info(f"Found {self.get_name()} device: {ip} ({mac}) - {desc}")
-                        logger.info(warning_msg)
-            return devices
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Error running arp-scan: {e}")
-            return []
+            pending = []
+            for port in ports:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                socks[sock] = port
+                sock.setblocking(False)
+                result = sock.connect_ex((ip, port))
+                if result == 0:
+                    logger.info(f"Successfully connected to port {port}")
+                    return True
+                if result in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                    pending.append(sock)
+                else:
+                    # Failed immediately (e.g. unreachable), select would report it writable
+                    logger.debug(f"Connection to {ip}:{port} failed: {errno.errorcode.get(result, result)}")
+
+            deadline = time.monotonic() + timeout
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                _, writable, _ = select.select([], pending, [], remaining)
+                if not writable:
+                    break
+                for sock in writable:
+                    # Writable also means a failed connect, check the result
+                    if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                        logger.info(f"Successfully connected to port {socks[sock]}")
+                        return True
+                    pending.remove(sock)
+            return False
         except Exception as e:
-            logger.error(f"Error during network scan: {e}")
-            return []
+            logger.debug(f"Socket connection to {ip} failed: {str(e)}")
+            return False
+        finally:
+            for sock in socks:
+                sock.close()
 
     @abstractmethod
     def _is_tv_device(self, description: Optional[str]) -> bool:
@@ -89,29 +246,122 @@ class TVDiscoveryBase(ABC):
         """Add additional device-specific information"""
         pass
 
+def _mac_to_oui(mac: str) -> int:
+    """Convert a MAC address or prefix ('AA:BB:CC...') to its 24-bit OUI"""
+    return int(mac.replace(':', '').replace('-', '')[:6], 16)
+
 class TVDiscoveryFactory:
     """Factory for creating TV discovery implementations"""
 
     _discoveries = {}
+    # OUI -> [(tv_type, discovery)], shared by all registered discoveries.
+    # A list because a few OUIs are claimed by more than one vendor table.
+    _oui_index: Dict[int, List[Tuple[str, TVDiscoveryBase]]] = {}
 
     @classmethod
     def register(cls, tv_type: str, discovery_class): 
         """Register a discovery implementation for a TV type"""
+        discovery_class.tv_type = tv_type
         cls._discoveries[tv_type] = discovery_class
+        cls._rebuild_oui_index()
+
+    @classmethod
+    def _rebuild_oui_index(cls):
+        """Index every registered discovery's MAC prefixes by integer OUI"""
+        index = {}
+        for tv_type, discovery in cls._discoveries.items():
+            for prefix in discovery.get_mac_prefixes():
+                index.setdefault(_mac_to_oui(prefix), []).append((tv_type, discovery))
+        cls._oui_index = index
+
+    @classmethod
+    def register_cls(cls, tv_type: str):
+        """Class decorator registering an instance of a discovery implementation"""
+        def decorator(discovery_class):
+            cls.register(tv_type, discovery_class())
+            return discovery_class
+        return decorator
 
     @classmethod
     def get_discovery(cls, tv_type: str) -> Optional[TVDiscoveryBase]:
         """Get discovery implementation for given TV type"""
-        if tv_type not in cls._discoveries:
-            # Import and register discovery implementations on first use
-            if tv_type == 'webos':
-                from ..discovery.webos_discovery import WebOSDiscovery
-                cls.register('webos', WebOSDiscovery())  
-            elif tv_type == 'tizen':
-                from ..discovery.tizen_discovery import TizenDiscovery
-                cls.register('tizen', TizenDiscovery())  
-            elif tv_type == 'android':
-                from ..discovery.android_discovery import AndroidDiscovery
-                cls.register('android', AndroidDiscovery())  
-
         return cls._discoveries.get(tv_type)
+
+    @classmethod
+    def classify(cls, ip: str, mac: str, desc: Optional[str], oui: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Match a single ARP row against all registered TV types.
+
+        When an OUI is shared by several vendor tables the description
+        decides; if it can't, a device is reported for every candidate type.
+        """
+        candidates = cls._oui_index.get(_mac_to_oui(mac) if oui is None else oui, [])
+        if len(candidates) > 1 and desc:
+            candidates = [(t, d) for t, d in candidates if d._is_tv_device(desc)] or candidates
+        elif not candidates and desc:
+            candidates = [(t, d) for t, d in cls._discoveries.items() if d._is_tv_device(desc)]
+
+        devices = []
+        for tv_type, discovery in candidates:
+            device = discovery.build_device(ip, mac, desc)
+            device['tv_type'] = tv_type
+            devices.append(device)
+        return devices
+
+    @classmethod
+    def _classify_entry(cls, entry: ArpEntry, blacklist: FrozenSet[str], seen: set) -> List[Dict[str, Any]]:
+        """Classify one ARP row, skipping blacklisted and already seen MACs"""
+        ip, mac, desc = entry
+        key = mac.lower()
+        if key in blacklist:
+            logger.debug(f"Skipping blacklisted device: {mac}")
+            return []
+        if key in seen:
+            return []
+        seen.add(key)
+        return cls.classify(ip, mac, desc, _mac_to_oui(mac))
+
+    @classmethod
+    def _classify_entries(cls, entries: List[ArpEntry]) -> List[Dict[str, Any]]:
+        """Classify ARP rows, skipping blacklisted and duplicate MACs"""
+        blacklist = _get_blacklist_set()
+        logger.debug(f"Loaded blacklist: {sorted(blacklist)}")
+        seen = set()
+        devices = []
+        for entry in entries:
+            devices.extend(cls._classify_entry(entry, blacklist, seen))
+        return devices
+
+    @classmethod
+    def scan_network(cls) -> List[Dict[str, Any]]:
+        """Scan network once and classify devices for every TV type"""
+        try:
+            return cls._classify_entries(_get_arp_table())
+        except OSError as e:
+            logger.error(f"Error reading ARP table: {e}")
+            return []
+        except Exception as e:
+            logger.error(f"Error during network scan: {e}")
+            return []
+
+    @classmethod
+    async def iter_all(cls) -> AsyncIterator[Dict[str, Any]]:
+        """Yield devices of every TV type while arp-scan is still sweeping"""
+        blacklist = _get_blacklist_set()
+        logger.debug(f"Loaded blacklist: {sorted(blacklist)}")
+        seen = set()
+        async for entry in _iter_arp_table_async():
+            for device in cls._classify_entry(entry, blacklist, seen):
+                yield device
+
+    @classmethod
+    async def scan_all(cls) -> List[Dict[str, Any]]:
+        """Async variant of scan_network: one arp-scan, classified as rows arrive"""
+        try:
+            return [device async for device in cls.iter_all()]
+        except OSError as e:
+            logger.error(f"Error reading ARP table: {e}")
+            return []
+        except Exception as e:
+            logger.error(f"Error during network scan: {e}")
+            return []
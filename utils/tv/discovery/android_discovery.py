@@ -11,6 +11,7 @@ from ..base.tv_discovery import TVDiscoveryBase, TVDiscoveryFactory
 
 logger = logging.getLogger(__name__)
 
+@TVDiscoveryFactory.register_cls('android')
 class AndroidDiscovery(TVDiscoveryBase):
     """Discovery implementation for Sony Android TVs"""
 
@@ -96,19 +97,9 @@ class AndroidDiscovery(TVDiscoveryBase):
 
             # Then try socket connections
             android_ports = [5555, 5037, 6466]  # ADB and pairing ports
-            for port in android_ports:
-                try:
-                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                    sock.settimeout(1)
-                    result = sock.connect_ex((ip, port))
-                    sock.close()
-
-                    if result == 0:
-                        logger.info(f"Successfully connected to port {port}")
-                        return True
-                except Exception as e:
-                    logger.debug(f"Socket connection to port {port} failed: {str(e)}")
-                    continue
+            loop = asyncio.get_running_loop()
+            if await loop.run_in_executor(None, self._probe_ports, ip, android_ports):
+                return True
 
             # Try ADB connection as final check
             try:
@@ -198,6 +189,3 @@ class AndroidDiscovery(TVDiscoveryBase):
         except Exception as e:
             logger.error(f"Error in mDNS scan: {e}")
             return []
-
-# Register the discoverer
-TVDiscoveryFactory.register('android', AndroidDiscovery())
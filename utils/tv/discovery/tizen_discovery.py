@@ -8,6 +8,7 @@ from ..base.tv_discovery import TVDiscoveryBase, TVDiscoveryFactory
 
 logger = logging.getLogger(__name__)
 
+@TVDiscoveryFactory.register_cls('tizen')
 class TizenDiscovery(TVDiscoveryBase):
     """Discovery implementation for Samsung Tizen TVs"""
 
@@ -124,19 +125,9 @@ class TizenDiscovery(TVDiscoveryBase):
 
             # Then try socket connections to known Tizen ports
             tizen_ports = [8001, 8002, 8080]
-            for port in tizen_ports:
-                try:
-                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                    sock.settimeout(1)
-                    result = sock.connect_ex((ip, port))
-                    sock.close()
-
-                    if result == 0:
-                        logger.info(f"Successfully connected to port {port}")
-                        return True
-                except Exception as e:
-                    logger.debug(f"Socket connection to port {port} failed: {str(e)}")
-                    continue
+            loop = asyncio.get_running_loop()
+            if await loop.run_in_executor(None, self._probe_ports, ip, tizen_ports):
+                return True
 
             # Try REST API endpoint as final check
             try:
@@ -191,6 +182,3 @@ class TizenDiscovery(TVDiscoveryBase):
         except Exception as e:
             logger.info(f"Netcat test failed: {str(e)}")
             return False
-
-# Register the discoverer
-TVDiscoveryFactory.register('tizen', TizenDiscovery())
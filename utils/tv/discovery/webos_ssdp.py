@@ -0,0 +1,160 @@
+import logging
+import socket
+import struct
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from ..base.tv_discovery import _read_proc_arp
+
+logger = logging.getLogger(__name__)
+
+SSDP_ADDR = '239.255.255.250'
+SSDP_PORT = 1900
+WEBOS_URN = 'urn:lge-com:service:webos-second-screen:1'
+
+M_SEARCH = (
+    'M-SEARCH * HTTP/1.1\r\n'
+    f'HOST: {SSDP_ADDR}:{SSDP_PORT}\r\n'
+    'MAN: "ssdp:discover"\r\n'
+    'MX: 2\r\n'
+    f'ST: {WEBOS_URN}\r\n'
+    '\r\n'
+).encode()
+
+def _parse_headers(data: bytes) -> Tuple[str, Dict[str, str]]:
+    """Split an SSDP datagram into its start line and lower-cased headers"""
+    lines = data.decode('utf-8', errors='replace').split('\r\n')
+    headers = {}
+    for line in lines[1:]:
+        key, sep, value = line.partition(':')
+        if sep:
+            headers[key.strip().lower()] = value.strip()
+    return lines[0], headers
+
+def _lookup_mac(ip: str) -> Optional[str]:
+    try:
+        for entry_ip, mac, _ in _read_proc_arp():
+            if entry_ip == ip:
+                return mac
+    except OSError:
+        pass
+    return None
+
+class WebOSSSDPListener(threading.Thread):
+    """
+    Background listener for WebOS SSDP announcements.
+
+    Joins the SSDP multicast group and records every TV that sends an
+    ssdp:alive NOTIFY or answers the initial M-SEARCH, so TVs show up
+    without waiting for an ARP sweep to catch them.
+    """
+
+    def __init__(self):
+        super().__init__(daemon=True, name='webos-ssdp')
+        self.running = True
+        self._sock = None
+        self._lock = threading.Lock()
+        self._devices: Dict[str, Dict[str, Optional[str]]] = {}  # USN -> {ip, mac, server}
+
+    def _open_socket(self) -> socket.socket:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if hasattr(socket, 'SO_REUSEPORT'):
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.bind(('', SSDP_PORT))
+        mreq = struct.pack('4s4s', socket.inet_aton(SSDP_ADDR), socket.inet_aton('0.0.0.0'))
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
+        sock.settimeout(1.0)
+        return sock
+
+    def _resolve_mac(self, ip: str, wait: float = 1.0) -> Optional[str]:
+        """Find the TV's MAC, nudging the kernel to resolve it if needed"""
+        mac = _lookup_mac(ip)
+        if mac or not self._sock:
+            return mac
+        try:
+            # Any unicast datagram makes the kernel ARP for the address
+            self._sock.sendto(b'', (ip, SSDP_PORT))
+        except OSError:
+            return None
+        deadline = time.monotonic() + wait
+        while time.monotonic() < deadline:
+            time.sleep(0.1)
+            mac = _lookup_mac(ip)
+            if mac:
+                return mac
+        return None
+
+    def _handle(self, data: bytes, ip: str):
+        start_line, headers = _parse_headers(data)
+        usn = headers.get('usn')
+        if not usn:
+            return
+
+        if start_line.startswith('NOTIFY'):
+            if headers.get('nt') != WEBOS_URN:
+                return
+            if headers.get('nts') == 'ssdp:byebye':
+                with self._lock:
+                    if self._devices.pop(usn, None):
+                        logger.info(f"WebOS TV at {ip} left the network")
+                return
+        elif not (start_line.startswith('HTTP/') and headers.get('st') == WEBOS_URN):
+            return
+
+        with self._lock:
+            known = self._devices.get(usn)
+        if known and known['ip'] == ip and known['mac']:
+            return
+
+        mac = self._resolve_mac(ip)
+        with self._lock:
+            self._devices[usn] = {'ip': ip, 'mac': mac, 'server': headers.get('server')}
+        logger.info(f"WebOS TV announced itself: {ip} ({mac})")
+
+    def run(self):
+        try:
+            self._sock = self._open_socket()
+            self._sock.sendto(M_SEARCH, (SSDP_ADDR, SSDP_PORT))
+        except OSError as e:
+            logger.warning(f"WebOS SSDP listener disabled: {str(e)}")
+            return
+
+        logger.info("WebOS SSDP listener started")
+        while self.running:
+            try:
+                data, (ip, _) = self._sock.recvfrom(4096)
+            except socket.timeout:
+                continue
+            except OSError as e:
+                logger.error(f"WebOS SSDP listener error: {str(e)}")
+                break
+            try:
+                self._handle(data, ip)
+            except Exception as e:
+                logger.error(f"Error handling SSDP message from {ip}: {str(e)}")
+        self._sock.close()
+
+    def get_devices(self) -> List[Tuple[str, str, Optional[str]]]:
+        """Return (ip, mac, server) for every announced TV with a known MAC"""
+        with self._lock:
+            devices = list(self._devices.items())
+
+        found = []
+        for usn, device in devices:
+            mac = device['mac'] or self._resolve_mac(device['ip'], wait=0.3)
+            if not mac:
+                continue
+            if not device['mac']:
+                with self._lock:
+                    if usn in self._devices:
+                        self._devices[usn]['mac'] = mac
+            found.append((device['ip'], mac, device['server']))
+        return found
+
+    def stop(self):
+        self.running = False
+
+# Shared listener, started once by the app
+ssdp_listener = WebOSSSDPListener()
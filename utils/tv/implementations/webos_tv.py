@@ -1,14 +1,34 @@
 import asyncio
+import hashlib
 import logging
 import json
+import os
+import time
 from typing import List, Optional
-from pywebostv.connection import WebOSClient
-from pywebostv.controls import ApplicationControl
 
 from ..base.tv_base import TVControlBase, TVError, TVConnectionError, TVAppError
 
 logger = logging.getLogger(__name__)
 
+# (file mtime_ns, content hash, parsed store), keyed by store path
+_store_cache = {}
+
+# Seconds before the installed app index is fetched from the TV again
+APPS_CACHE_TTL = 60
+
+# (fetch time, installed apps by lowercase title), keyed by TV MAC or IP.
+# Module level because a new WebOSTV is created for every request.
+_apps_cache = {}
+
+def _store_digest(store: dict) -> bytes:
+    return hashlib.blake2b(json.dumps(store, sort_keys=True).encode()).digest()
+
+def _store_mtime(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
 class WebOSTV(TVControlBase):
     """Implementation for LG WebOS TV control"""
 
@@ -31,21 +51,39 @@ class WebOSTV(TVControlBase):
         return 'lg'
 
     def _load_store(self) -> dict:
-        """Load TV client store from disk"""
+        """Load TV client store, re-reading from disk only when the file changed"""
+        mtime = _store_mtime(self._store_path)
+        cached = _store_cache.get(self._store_path)
+        if cached and cached[0] == mtime:
+            return dict(cached[2])
+
         try:
             with open(self._store_path, 'r') as f:
-                return json.load(f)
+                store = json.load(f)
         except FileNotFoundError:
-            return {}
+            store = {}
         except Exception as e:
             logger.error(f"Error loading store: {e}")
             return {}
 
+        _store_cache[self._store_path] = (mtime, _store_digest(store), store)
+        return dict(store)
+
     def _save_store(self, store: dict):
-        """Save TV client store to disk"""
+        """Save TV client store to disk atomically, skipping unchanged stores"""
+        digest = _store_digest(store)
+        cached = _store_cache.get(self._store_path)
+        if cached and cached[1] == digest and os.path.exists(self._store_path):
+            return
+
         try:
-            with open(self._store_path, 'w') as f:
+            # Save to disk atomically
+            temp_path = f"{self._store_path}.tmp"
+            with open(temp_path, 'w') as f:
                 json.dump(store, f)
+            os.replace(temp_path, self._store_path)
+
+            _store_cache[self._store_path] = (_store_mtime(self._store_path), digest, dict(store))
         except Exception as e:
             logger.error(f"Error saving store: {e}")
 
@@ -55,21 +93,28 @@ class WebOSTV(TVControlBase):
             if not self.ip:
                 raise TVConnectionError("No IP address configured")
 
+            # Imported lazily so loading this module doesn't pull in pywebostv
+            from pywebostv.connection import WebOSClient
+
             logger.info(f"Attempting to connect to TV at {self.ip}")
             store = self._load_store()
-            
-            self._client = WebOSClient(self.ip)
-            self._client.connect()
-
-            for status in self._client.register(store):
-                if status == WebOSClient.PROMPTED:
-                    logger.info("Please accept the connection on your TV")
-                elif status == WebOSClient.REGISTERED:
-                    logger.info("TV registration successful")
-                    self._save_store(store)
-                    return True
 
-            return False
+            def connect_and_register() -> bool:
+                self._client = WebOSClient(self.ip)
+                self._client.connect()
+
+                for status in self._client.register(store):
+                    if status == WebOSClient.PROMPTED:
+                        logger.info("Please accept the connection on your TV")
+                    elif status == WebOSClient.REGISTERED:
+                        logger.info("TV registration successful")
+                        self._save_store(store)
+                        return True
+                return False
+
+            # The websocket handshake and pairing prompt block, keep them off the event loop
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, connect_and_register)
 
         except Exception as e:
             logger.error(f"Connection failed: {e}")
@@ -102,30 +147,48 @@ class WebOSTV(TVControlBase):
             raise TVConnectionError("Not connected to TV")
 
         try:
+            from pywebostv.controls import ApplicationControl
             app_control = ApplicationControl(self._client)
             return app_control.list_apps()
         except Exception as e:
             logger.error(f"Error getting installed apps: {e}")
             raise TVError(f"Failed to get app list: {e}")
 
+    def _get_app_index(self, app_control, refresh: bool = False) -> dict:
+        """Get installed apps by lowercase title, refreshing after APPS_CACHE_TTL seconds"""
+        key = (self.mac or self.ip or '').lower()
+        cached = _apps_cache.get(key)
+        if refresh or not cached or time.monotonic() - cached[0] > APPS_CACHE_TTL:
+            index = {app['title'].lower(): app for app in app_control.list_apps()}
+            cached = _apps_cache[key] = (time.monotonic(), index)
+        return cached[1]
+
+    @staticmethod
+    def _find_app(index: dict, app_names: List[str]) -> Optional[dict]:
+        """Match app names against the index, exact titles first"""
+        target_app = next((index[name] for name in app_names if name in index), None)
+        if not target_app:
+            target_app = next(
+                (app for title, app in index.items() if any(name in title for name in app_names)),
+                None
+            )
+        return target_app
+
     async def launch_app(self, app_id: str) -> bool:
         """Launch app with given ID"""
         if not self._client:
             raise TVConnectionError("Not connected to TV")
 
         try:
+            from pywebostv.controls import ApplicationControl
             app_control = ApplicationControl(self._client)
-            apps = app_control.list_apps()
-            
-            # Look for app matching any of the possible names
-            target_app = None
             app_names = app_id if isinstance(app_id, list) else [app_id]
-            
-            for app in apps:
-                app_title = app['title'].lower()
-                if any(name in app_title for name in app_names):
-                    target_app = app
-                    break
+
+            # Look for app matching any of the possible names; a miss may just
+            # mean the app was installed since the index was cached
+            target_app = self._find_app(self._get_app_index(app_control), app_names)
+            if not target_app:
+                target_app = self._find_app(self._get_app_index(app_control, refresh=True), app_names)
 
             if target_app:
                 app_control.launch(target_app)
@@ -139,15 +202,17 @@ class WebOSTV(TVControlBase):
             logger.error(f"Error launching app: {e}")
             raise TVAppError(f"Failed to launch app: {e}")
 
-    async def _wait_for_tv(self):
-        """Wait for TV to become available after wake"""
-        max_attempts = 20
-        for attempt in range(max_attempts):
+    async def _wait_for_tv(self, max_retries: int = 8, max_delay: float = 4.0):
+        """Wait for TV to become available after wake, backing off exponentially"""
+        delay = 1.0
+        for attempt in range(max_retries):
             if await self.is_available():
                 logger.info(f"TV became available after {attempt + 1} attempts")
                 await asyncio.sleep(2)  # Give it a little more time to stabilize
                 return True
-            await asyncio.sleep(1)
+            if attempt < max_retries - 1:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, max_delay)
         return False
 
     async def get_power_state(self) -> str: